@@ -0,0 +1,117 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+# (name, min, max) for the five standard cron fields.
+FIELDS = (
+    ("minute", 0, 59),
+    ("hour", 0, 23),
+    ("day", 1, 31),
+    ("month", 1, 12),
+    ("weekday", 0, 7),
+)
+# Upper bound on candidate steps; comfortably covers rare dates like Feb 29.
+MAX_STEPS = 5000
+
+
+def _parse_field(expr: str, name: str, low: int, high: int) -> frozenset[int]:
+    values: set[int] = set()
+    for part in expr.split(","):
+        base, _, step_expr = part.partition("/")
+        step = int(step_expr) if step_expr else 1
+        if step < 1:
+            raise ValueError(f"Invalid step in {name} field: {part!r}")
+
+        if base == "*":
+            start, end = low, high
+        elif "-" in base:
+            start_expr, end_expr = base.split("-", 1)
+            start, end = int(start_expr), int(end_expr)
+        else:
+            start = int(base)
+            end = high if step_expr else start
+
+        if not low <= start <= end <= high:
+            raise ValueError(f"Value out of range in {name} field: {part!r}")
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
+
+
+@dataclass(frozen=True)
+class CronExpression:
+    minutes: frozenset[int]
+    hours: frozenset[int]
+    days: frozenset[int]
+    months: frozenset[int]
+    weekdays: frozenset[int]
+    day_restricted: bool
+    weekday_restricted: bool
+
+    @classmethod
+    def parse(cls, expr: str) -> "CronExpression":
+        parts = expr.split()
+        if len(parts) != len(FIELDS):
+            raise ValueError(
+                f"Cron expression must have {len(FIELDS)} fields, got {len(parts)}"
+            )
+        try:
+            minutes, hours, days, months, weekdays = (
+                _parse_field(part, name, low, high)
+                for part, (name, low, high) in zip(parts, FIELDS)
+            )
+        except ValueError as exc:
+            raise ValueError(f"Invalid cron expression {expr!r}: {exc}") from None
+
+        # Both 0 and 7 mean Sunday.
+        if 7 in weekdays:
+            weekdays = (weekdays - {7}) | {0}
+
+        return cls(
+            minutes=minutes,
+            hours=hours,
+            days=days,
+            months=months,
+            weekdays=weekdays,
+            # Like Vixie cron, a field starting with "*" (e.g. "*/2") is unrestricted.
+            day_restricted=not parts[2].startswith("*"),
+            weekday_restricted=not parts[4].startswith("*"),
+        )
+
+    def _matches_day(self, moment: datetime) -> bool:
+        day_ok = moment.day in self.days
+        weekday_ok = (moment.weekday() + 1) % 7 in self.weekdays
+        # Standard cron: when both day fields are restricted, either may match.
+        if self.day_restricted and self.weekday_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def next_after(self, moment: datetime) -> datetime:
+        """Return the first matching minute strictly after ``moment``."""
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+
+        for _ in range(MAX_STEPS):
+            if candidate.month not in self.months:
+                year = candidate.year + candidate.month // 12
+                month = candidate.month % 12 + 1
+                candidate = candidate.replace(
+                    year=year, month=month, day=1, hour=0, minute=0
+                )
+            elif not self._matches_day(candidate):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+            elif candidate.hour not in self.hours:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+            elif candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+            else:
+                return candidate
+
+        raise ValueError("Cron expression never matches")
+
+    def shortest_interval(self, after: datetime, samples: int = 50) -> timedelta:
+        """Return the smallest gap between the next ``samples`` occurrences."""
+        previous = self.next_after(after)
+        shortest = timedelta.max
+        for _ in range(samples):
+            current = self.next_after(previous)
+            shortest = min(shortest, current - previous)
+            previous = current
+        return shortest
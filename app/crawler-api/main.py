@@ -2,17 +2,32 @@ import json
 import logging
 import os
 import uuid
+from contextlib import asynccontextmanager
 from pathlib import Path
 import httpx
 from fastapi import FastAPI, HTTPException
 
-from models import CrawlResponse, CrawlResult
+from models import CrawlResponse, CrawlResult, Schedule, ScheduleCreate
+from scheduler import WARM_CACHE_TTL, Scheduler
 
 logging.basicConfig(level=logging.INFO)
-app = FastAPI(title="Crawler API")
 
 OSCAR_SERVICE_URL = os.environ.get("OSCAR_SERVICE_URL", "http://oscar:8000")
 DATA_DIR = Path(os.environ.get("DATA_DIR", "/app/data"))
+SCHEDULER_ENABLED = os.environ.get("SCHEDULER_ENABLED", "true").lower() == "true"
+
+scheduler = Scheduler(OSCAR_SERVICE_URL, DATA_DIR)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if SCHEDULER_ENABLED:
+        await scheduler.start()
+    yield
+    await scheduler.stop()
+
+
+app = FastAPI(title="Crawler API", lifespan=lifespan)
 
 
 @app.post("/crawl/oscar", response_model=CrawlResponse)
@@ -40,6 +55,14 @@ async def crawl_oscar():
     return CrawlResponse(job_id=job_id, status="pending")
 
 
+@app.get("/results/latest", response_model=CrawlResult)
+async def get_latest_result():
+    snapshot = scheduler.latest_snapshot()
+    if snapshot is None:
+        raise HTTPException(status_code=404, detail="No completed snapshot yet")
+    return snapshot
+
+
 @app.get("/results/{job_id}", response_model=CrawlResult)
 async def get_results(job_id: str):
     path = (DATA_DIR / f"{job_id}.json").resolve()
@@ -52,3 +75,32 @@ async def get_results(job_id: str):
 
     data = json.loads(path.read_text())
     return CrawlResult(**data)
+
+
+@app.post("/schedules", response_model=Schedule, status_code=201)
+async def create_schedule(request: ScheduleCreate):
+    if request.prewarm_seconds > WARM_CACHE_TTL:
+        raise HTTPException(
+            status_code=422,
+            detail=f"prewarm_seconds exceeds WARM_CACHE_TTL ({WARM_CACHE_TTL:.0f}s)",
+        )
+    return scheduler.add(request)
+
+
+@app.get("/schedules", response_model=list[Schedule])
+async def list_schedules():
+    return list(scheduler.schedules.values())
+
+
+@app.get("/schedules/{schedule_id}", response_model=Schedule)
+async def get_schedule(schedule_id: str):
+    schedule = scheduler.schedules.get(schedule_id)
+    if schedule is None:
+        raise HTTPException(status_code=404, detail="Schedule not found")
+    return schedule
+
+
+@app.delete("/schedules/{schedule_id}", status_code=204)
+async def delete_schedule(schedule_id: str):
+    if not scheduler.remove(schedule_id):
+        raise HTTPException(status_code=404, detail="Schedule not found")
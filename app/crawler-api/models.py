@@ -1,7 +1,9 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from cron import CronExpression
 
 
 class Film(BaseModel):
@@ -16,6 +18,7 @@ class CrawlResult(BaseModel):
     job_id: str
     status: Literal["pending", "running", "completed", "failed"]
     films: list[Film] = []
+    started_at: datetime | None = None
     crawled_at: datetime | None = None
     error: str | None = None
 
@@ -23,3 +26,40 @@ class CrawlResult(BaseModel):
 class CrawlResponse(BaseModel):
     job_id: str
     status: str
+
+
+class ScheduleBase(BaseModel):
+    cron: str
+    jitter_seconds: float = Field(default=0, ge=0)
+    prewarm_seconds: float = Field(default=0, ge=0)
+    stagger_seconds: float = Field(default=0, ge=0)
+
+
+class ScheduleCreate(ScheduleBase):
+
+    @field_validator("cron")
+    @classmethod
+    def validate_cron(cls, v: str) -> str:
+        CronExpression.parse(v).next_after(datetime.now(timezone.utc))
+        return v.strip()
+
+    @model_validator(mode="after")
+    def check_fits_interval(self) -> "ScheduleCreate":
+        interval = CronExpression.parse(self.cron).shortest_interval(
+            datetime.now(timezone.utc)
+        )
+        if self.jitter_seconds + self.prewarm_seconds >= interval.total_seconds():
+            raise ValueError(
+                "jitter_seconds + prewarm_seconds must be shorter than the "
+                f"schedule interval ({interval.total_seconds():.0f}s)"
+            )
+        return self
+
+
+# Saved schedules skip the create-time checks, which depend on the current
+# time and configuration and could stop a stored schedule from loading.
+class Schedule(ScheduleBase):
+    id: str
+    next_run_at: datetime | None = None
+    last_job_id: str | None = None
+    last_run_at: datetime | None = None
@@ -0,0 +1,246 @@
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import random
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import httpx
+from pydantic import TypeAdapter
+
+from cron import CronExpression
+from models import CrawlResult, Schedule, ScheduleCreate
+
+logger = logging.getLogger(__name__)
+
+SCHEDULES_FILE = "schedules"
+LATEST_POINTER = "latest"
+TICK_SECONDS = 1.0
+HTTP_TIMEOUT = 10
+# A run still "pending"/"running" after this long is assumed dead.
+RUN_TIMEOUT = float(os.environ.get("SCHEDULE_RUN_TIMEOUT", 3600))
+# Must match the oscar service: warmed data older than this is discarded.
+WARM_CACHE_TTL = float(os.environ.get("WARM_CACHE_TTL", 300))
+
+_schedule_list = TypeAdapter(list[Schedule])
+
+
+@dataclass
+class _Slot:
+    fire_at: datetime
+    prewarmed: bool = False
+
+
+class Scheduler:
+    def __init__(self, oscar_url: str, data_dir: Path):
+        self.oscar_url = oscar_url
+        self.data_dir = data_dir
+        self.schedules: dict[str, Schedule] = {}
+        self._slots: dict[str, _Slot] = {}
+        self._client: httpx.AsyncClient | None = None
+        self._task: asyncio.Task | None = None
+        self._snapshot: CrawlResult | None = None
+
+    def add(self, request: ScheduleCreate, now: datetime | None = None) -> Schedule:
+        schedule = Schedule(id=str(uuid.uuid4()), **request.model_dump())
+        self.schedules[schedule.id] = schedule
+        self._plan(schedule, now or datetime.now(timezone.utc))
+        self._persist()
+        logger.info("Added schedule %s (%s)", schedule.id, schedule.cron)
+        return schedule
+
+    def remove(self, schedule_id: str) -> bool:
+        if self.schedules.pop(schedule_id, None) is None:
+            return False
+        self._slots.pop(schedule_id, None)
+        self._persist()
+        logger.info("Removed schedule %s", schedule_id)
+        return True
+
+    def load(self, now: datetime | None = None) -> None:
+        path = self.data_dir / SCHEDULES_FILE
+        if not path.exists():
+            return
+        try:
+            rows = json.loads(path.read_text())
+        except (OSError, ValueError) as exc:
+            logger.error("Could not read %s, starting without schedules: %s", path, exc)
+            return
+        if not isinstance(rows, list):
+            logger.error("Ignoring %s: expected a list of schedules", path)
+            return
+
+        now = now or datetime.now(timezone.utc)
+        for row in rows:
+            try:
+                schedule = Schedule.model_validate(row)
+                if schedule.prewarm_seconds > WARM_CACHE_TTL:
+                    logger.warning(
+                        "Clamping prewarm_seconds of schedule %s to WARM_CACHE_TTL",
+                        schedule.id,
+                    )
+                    schedule.prewarm_seconds = WARM_CACHE_TTL
+                self._plan(schedule, now)
+            except ValueError as exc:
+                logger.error("Skipping invalid saved schedule: %s", exc)
+                continue
+            self.schedules[schedule.id] = schedule
+        logger.info("Loaded %d schedules", len(self.schedules))
+
+    def _persist(self) -> None:
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        path = self.data_dir / SCHEDULES_FILE
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(_schedule_list.dump_json(list(self.schedules.values())))
+        os.replace(tmp, path)
+
+    def _plan(self, schedule: Schedule, after: datetime) -> None:
+        next_run = CronExpression.parse(schedule.cron).next_after(after)
+        jitter = random.uniform(0, schedule.jitter_seconds)
+        schedule.next_run_at = next_run
+        self._slots[schedule.id] = _Slot(fire_at=next_run + timedelta(seconds=jitter))
+
+    def latest_snapshot(self) -> CrawlResult | None:
+        pointer = self.data_dir / LATEST_POINTER
+        if not pointer.exists():
+            return self._snapshot
+        # An unreadable pointer or snapshot keeps the last good one in service.
+        try:
+            job_id = pointer.read_text().strip()
+            if self._snapshot is None or self._snapshot.job_id != job_id:
+                path = self.data_dir / f"{job_id}.json"
+                self._snapshot = CrawlResult.model_validate_json(path.read_text())
+        except (OSError, ValueError) as exc:
+            logger.warning("Could not load latest snapshot: %s", exc)
+        return self._snapshot
+
+    async def start(self) -> None:
+        self.load()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _run(self) -> None:
+        while True:
+            await self.tick(datetime.now(timezone.utc))
+            await asyncio.sleep(TICK_SECONDS)
+
+    async def tick(self, now: datetime) -> None:
+        for schedule in list(self.schedules.values()):
+            try:
+                await self._advance(schedule, now)
+            except Exception:
+                logger.exception("Schedule %s failed to advance", schedule.id)
+        self.latest_snapshot()
+
+    async def _advance(self, schedule: Schedule, now: datetime) -> None:
+        # Schedules can be deleted through the API while a tick awaits HTTP.
+        if schedule.id not in self.schedules:
+            return
+        slot = self._slots[schedule.id]
+        prewarm_at = slot.fire_at - timedelta(seconds=schedule.prewarm_seconds)
+        if schedule.prewarm_seconds and not slot.prewarmed and now >= prewarm_at:
+            slot.prewarmed = True
+            if self._is_running(schedule, now):
+                logger.info(
+                    "Skipping pre-warm for schedule %s: job %s still running",
+                    schedule.id,
+                    schedule.last_job_id,
+                )
+            else:
+                await self._prewarm(schedule)
+                if schedule.id not in self.schedules:
+                    return
+
+        if now < slot.fire_at:
+            return
+
+        if self._is_running(schedule, now):
+            logger.info(
+                "Skipping schedule %s: job %s still running",
+                schedule.id,
+                schedule.last_job_id,
+            )
+        else:
+            await self._fire(schedule, now)
+
+        if schedule.id in self.schedules:
+            # Plan from the slot itself so jitter never swallows the next run.
+            self._plan(schedule, schedule.next_run_at)
+            if schedule.next_run_at <= now:
+                logger.warning(
+                    "Schedule %s fell behind, skipping missed runs", schedule.id
+                )
+                self._plan(schedule, now)
+            self._persist()
+
+    def _http(self) -> httpx.AsyncClient:
+        # Kept open between runs so scheduled requests reuse a warm connection.
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=HTTP_TIMEOUT)
+        return self._client
+
+    async def _prewarm(self, schedule: Schedule) -> None:
+        try:
+            response = await self._http().post(
+                f"{self.oscar_url}/warmup",
+                # Warm-up must finish inside the prewarm window to be useful.
+                json={
+                    "stagger_seconds": min(
+                        schedule.stagger_seconds, schedule.prewarm_seconds
+                    )
+                },
+            )
+            response.raise_for_status()
+            logger.info("Pre-warmed oscar service for schedule %s", schedule.id)
+        except httpx.HTTPError as exc:
+            logger.warning("Pre-warm failed for schedule %s: %s", schedule.id, exc)
+
+    def _is_running(self, schedule: Schedule, now: datetime) -> bool:
+        if schedule.last_job_id is None or schedule.last_run_at is None:
+            return False
+        if now - schedule.last_run_at > timedelta(seconds=RUN_TIMEOUT):
+            logger.warning(
+                "Job %s exceeded %ss, no longer blocking schedule %s",
+                schedule.last_job_id,
+                RUN_TIMEOUT,
+                schedule.id,
+            )
+            return False
+
+        path = self.data_dir / f"{schedule.last_job_id}.json"
+        if not path.exists():
+            return True
+        try:
+            status = json.loads(path.read_text())["status"]
+        except (ValueError, KeyError):
+            return True
+        return status in ("pending", "running")
+
+    async def _fire(self, schedule: Schedule, now: datetime) -> None:
+        job_id = str(uuid.uuid4())
+        try:
+            response = await self._http().post(
+                f"{self.oscar_url}/scrape",
+                json={"job_id": job_id, "stagger_seconds": schedule.stagger_seconds},
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as exc:
+            logger.error("Schedule %s could not start a crawl: %s", schedule.id, exc)
+            return
+
+        schedule.last_job_id = job_id
+        schedule.last_run_at = now
+        logger.info("Schedule %s started job %s", schedule.id, job_id)
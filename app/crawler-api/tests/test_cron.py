@@ -0,0 +1,72 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from cron import CronExpression
+
+START = datetime(2025, 1, 1, 12, 30, 15, tzinfo=timezone.utc)
+
+
+class TestParse:
+    def test_wildcard_covers_full_range(self):
+        cron = CronExpression.parse("* * * * *")
+        assert cron.minutes == frozenset(range(60))
+        assert cron.hours == frozenset(range(24))
+
+    def test_lists_ranges_and_steps(self):
+        cron = CronExpression.parse("0,30 9-17/4 * * *")
+        assert cron.minutes == {0, 30}
+        assert cron.hours == {9, 13, 17}
+
+    def test_sunday_as_seven(self):
+        cron = CronExpression.parse("0 0 * * 7")
+        assert cron.weekdays == {0}
+
+    @pytest.mark.parametrize(
+        "expr", ["* * * *", "60 * * * *", "*/0 * * * *", "a * * * *", "5-1 * * * *"]
+    )
+    def test_invalid_expressions(self, expr):
+        with pytest.raises(ValueError):
+            CronExpression.parse(expr)
+
+
+class TestNextAfter:
+    def test_every_minute(self):
+        assert CronExpression.parse("* * * * *").next_after(START) == datetime(
+            2025, 1, 1, 12, 31, tzinfo=timezone.utc
+        )
+
+    def test_top_of_hour(self):
+        assert CronExpression.parse("0 * * * *").next_after(START) == datetime(
+            2025, 1, 1, 13, 0, tzinfo=timezone.utc
+        )
+
+    def test_rolls_over_year(self):
+        assert CronExpression.parse("0 0 1 1 *").next_after(START) == datetime(
+            2026, 1, 1, 0, 0, tzinfo=timezone.utc
+        )
+
+    def test_weekday(self):
+        # 2025-01-01 is a Wednesday; next Monday is the 6th.
+        assert CronExpression.parse("0 8 * * 1").next_after(START) == datetime(
+            2025, 1, 6, 8, 0, tzinfo=timezone.utc
+        )
+
+    def test_day_or_weekday_when_both_restricted(self):
+        assert CronExpression.parse("0 8 15 * 1").next_after(START) == datetime(
+            2025, 1, 6, 8, 0, tzinfo=timezone.utc
+        )
+
+    def test_day_step_and_weekday_must_both_match(self):
+        # Odd days that are also Mondays: the 13th is the first in 2025.
+        assert CronExpression.parse("0 0 */2 * 1").next_after(START) == datetime(
+            2025, 1, 13, 0, 0, tzinfo=timezone.utc
+        )
+
+    def test_shortest_interval(self):
+        cron = CronExpression.parse("0,10 * * * *")
+        assert cron.shortest_interval(START).total_seconds() == 600
+
+    def test_never_matching_raises(self):
+        with pytest.raises(ValueError):
+            CronExpression.parse("0 0 30 2 *").next_after(START)
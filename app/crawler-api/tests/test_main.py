@@ -1,14 +1,22 @@
 import json
 
 import httpx
+import pytest
 import respx
 from fastapi.testclient import TestClient
 
 from main import OSCAR_SERVICE_URL, app
+from scheduler import WARM_CACHE_TTL, Scheduler
 
 client = TestClient(app)
 
 
+@pytest.fixture
+def tmp_scheduler(tmp_path, monkeypatch):
+    monkeypatch.setattr("main.scheduler", Scheduler(OSCAR_SERVICE_URL, tmp_path))
+    return tmp_path
+
+
 class TestCrawlOscarEndpoint:
     @respx.mock
     def test_triggers_crawl_returns_job_id(self):
@@ -81,3 +89,59 @@ class TestGetResultsEndpoint:
         assert data["status"] == "completed"
         assert len(data["films"]) == 1
         assert data["films"][0]["title"] == "The Artist"
+
+
+class TestLatestResultEndpoint:
+    def test_returns_404_without_snapshot(self, tmp_scheduler):
+        response = client.get("/results/latest")
+        assert response.status_code == 404
+
+    def test_returns_latest_snapshot(self, tmp_scheduler):
+        result = {"job_id": "snap-id", "status": "completed", "films": []}
+        (tmp_scheduler / "snap-id.json").write_text(json.dumps(result))
+        (tmp_scheduler / "latest").write_text("snap-id")
+
+        response = client.get("/results/latest")
+
+        assert response.status_code == 200
+        assert response.json()["job_id"] == "snap-id"
+
+    def test_returns_404_when_pointer_target_missing(self, tmp_scheduler):
+        (tmp_scheduler / "latest").write_text("missing-id")
+
+        response = client.get("/results/latest")
+        assert response.status_code == 404
+
+
+class TestSchedulesEndpoints:
+    def test_create_and_list(self, tmp_scheduler):
+        response = client.post(
+            "/schedules", json={"cron": "0 * * * *", "jitter_seconds": 120}
+        )
+
+        assert response.status_code == 201
+        created = response.json()
+        assert created["cron"] == "0 * * * *"
+        assert created["next_run_at"] is not None
+
+        listed = client.get("/schedules").json()
+        assert [s["id"] for s in listed] == [created["id"]]
+
+    def test_rejects_invalid_cron(self, tmp_scheduler):
+        response = client.post("/schedules", json={"cron": "every hour"})
+        assert response.status_code == 422
+
+    def test_rejects_prewarm_beyond_warm_cache_ttl(self, tmp_scheduler):
+        response = client.post(
+            "/schedules",
+            json={"cron": "0 0 * * *", "prewarm_seconds": WARM_CACHE_TTL + 1},
+        )
+        assert response.status_code == 422
+
+    def test_get_and_delete(self, tmp_scheduler):
+        schedule_id = client.post("/schedules", json={"cron": "* * * * *"}).json()["id"]
+
+        assert client.get(f"/schedules/{schedule_id}").status_code == 200
+        assert client.delete(f"/schedules/{schedule_id}").status_code == 204
+        assert client.get(f"/schedules/{schedule_id}").status_code == 404
+        assert client.delete(f"/schedules/{schedule_id}").status_code == 404
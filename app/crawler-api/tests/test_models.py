@@ -1,7 +1,7 @@
 import pytest
 from pydantic import ValidationError
 
-from models import CrawlResponse, CrawlResult, Film
+from models import CrawlResponse, CrawlResult, Film, ScheduleCreate
 
 
 class TestFilm:
@@ -37,3 +37,23 @@ class TestCrawlResponse:
         resp = CrawlResponse(job_id="abc-123", status="pending")
         assert resp.job_id == "abc-123"
         assert resp.status == "pending"
+
+
+class TestScheduleCreate:
+    def test_defaults(self):
+        schedule = ScheduleCreate(cron="0 * * * *")
+        assert schedule.jitter_seconds == 0
+        assert schedule.prewarm_seconds == 0
+        assert schedule.stagger_seconds == 0
+
+    def test_invalid_cron(self):
+        with pytest.raises(ValidationError):
+            ScheduleCreate(cron="0 * *")
+
+    def test_negative_jitter(self):
+        with pytest.raises(ValidationError):
+            ScheduleCreate(cron="0 * * * *", jitter_seconds=-1)
+
+    def test_jitter_and_prewarm_must_fit_interval(self):
+        with pytest.raises(ValidationError):
+            ScheduleCreate(cron="* * * * *", jitter_seconds=40, prewarm_seconds=20)
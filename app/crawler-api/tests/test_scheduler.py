@@ -0,0 +1,287 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+import respx
+
+from models import CrawlResult, ScheduleCreate
+from scheduler import LATEST_POINTER, Scheduler
+
+OSCAR_URL = "http://oscar.test"
+NOW = datetime(2025, 1, 1, 12, 0, 30, tzinfo=timezone.utc)
+NEXT_RUN = datetime(2025, 1, 1, 12, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def scheduler(tmp_path):
+    return Scheduler(OSCAR_URL, tmp_path)
+
+
+class TestScheduleManagement:
+    def test_add_plans_next_run(self, scheduler):
+        schedule = scheduler.add(ScheduleCreate(cron="* * * * *"), now=NOW)
+
+        assert schedule.next_run_at == NEXT_RUN
+        assert scheduler.schedules[schedule.id] is schedule
+
+    def test_schedules_survive_restart(self, scheduler, tmp_path):
+        schedule = scheduler.add(ScheduleCreate(cron="0 * * * *"), now=NOW)
+
+        restarted = Scheduler(OSCAR_URL, tmp_path)
+        restarted.load(now=NOW)
+
+        assert list(restarted.schedules) == [schedule.id]
+        assert restarted.schedules[schedule.id].cron == "0 * * * *"
+
+    def test_load_skips_schedules_that_no_longer_validate(
+        self, scheduler, tmp_path, monkeypatch
+    ):
+        monkeypatch.setattr("scheduler.WARM_CACHE_TTL", 10)
+        rows = [
+            {"id": "bad-cron", "cron": "not a cron"},
+            {"id": "missing-cron"},
+            {"id": "jittery", "cron": "* * * * *", "jitter_seconds": 600},
+            {"id": "slow-warm", "cron": "0 * * * *", "prewarm_seconds": 60},
+        ]
+        (tmp_path / "schedules").write_text(json.dumps(rows))
+
+        scheduler.load(now=NOW)
+
+        assert set(scheduler.schedules) == {"jittery", "slow-warm"}
+        assert scheduler.schedules["slow-warm"].prewarm_seconds == 10
+
+    def test_load_ignores_corrupt_file(self, scheduler, tmp_path):
+        (tmp_path / "schedules").write_text("{not json")
+
+        scheduler.load(now=NOW)
+
+        assert scheduler.schedules == {}
+
+    def test_remove(self, scheduler):
+        schedule = scheduler.add(ScheduleCreate(cron="* * * * *"), now=NOW)
+
+        assert scheduler.remove(schedule.id) is True
+        assert scheduler.remove(schedule.id) is False
+        assert scheduler.schedules == {}
+
+
+class TestTick:
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_fires_when_due(self, scheduler):
+        route = respx.post(f"{OSCAR_URL}/scrape").mock(
+            return_value=httpx.Response(200, json={"status": "pending"})
+        )
+        schedule = scheduler.add(
+            ScheduleCreate(cron="* * * * *", stagger_seconds=20), now=NOW
+        )
+
+        await scheduler.tick(NOW)
+        assert route.call_count == 0
+
+        await scheduler.tick(NEXT_RUN)
+        await scheduler.stop()
+
+        assert route.call_count == 1
+        body = json.loads(route.calls.last.request.content)
+        assert body["stagger_seconds"] == 20
+        assert schedule.last_job_id == body["job_id"]
+        assert schedule.next_run_at == NEXT_RUN + timedelta(minutes=1)
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_jitter_delays_fire(self, scheduler):
+        route = respx.post(f"{OSCAR_URL}/scrape").mock(
+            return_value=httpx.Response(200)
+        )
+        scheduler.add(ScheduleCreate(cron="* * * * *", jitter_seconds=30), now=NOW)
+
+        await scheduler.tick(NEXT_RUN - timedelta(seconds=1))
+        assert route.call_count == 0
+
+        await scheduler.tick(NEXT_RUN + timedelta(seconds=30))
+        await scheduler.stop()
+        assert route.call_count == 1
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_jitter_does_not_skip_next_run(self, scheduler, monkeypatch):
+        monkeypatch.setattr("scheduler.random.uniform", lambda a, b: b)
+        respx.post(f"{OSCAR_URL}/scrape").mock(return_value=httpx.Response(200))
+        schedule = scheduler.add(
+            ScheduleCreate(cron="* * * * *", jitter_seconds=50), now=NOW
+        )
+
+        await scheduler.tick(NEXT_RUN + timedelta(seconds=50))
+        await scheduler.stop()
+
+        assert schedule.next_run_at == NEXT_RUN + timedelta(minutes=1)
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_resumes_from_now_when_behind(self, scheduler):
+        respx.post(f"{OSCAR_URL}/scrape").mock(return_value=httpx.Response(200))
+        schedule = scheduler.add(ScheduleCreate(cron="* * * * *"), now=NOW)
+
+        await scheduler.tick(NEXT_RUN + timedelta(minutes=3, seconds=5))
+        await scheduler.stop()
+
+        assert schedule.next_run_at == NEXT_RUN + timedelta(minutes=4)
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_prewarms_before_run(self, scheduler):
+        warmup = respx.post(f"{OSCAR_URL}/warmup").mock(
+            return_value=httpx.Response(200)
+        )
+        scrape = respx.post(f"{OSCAR_URL}/scrape").mock(
+            return_value=httpx.Response(200)
+        )
+        scheduler.add(
+            ScheduleCreate(cron="* * * * *", prewarm_seconds=20, stagger_seconds=40),
+            now=NOW,
+        )
+
+        await scheduler.tick(NEXT_RUN - timedelta(seconds=10))
+        await scheduler.tick(NEXT_RUN - timedelta(seconds=5))
+        await scheduler.stop()
+
+        assert warmup.call_count == 1
+        assert json.loads(warmup.calls.last.request.content)["stagger_seconds"] == 20
+        assert scrape.call_count == 0
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_skips_while_previous_run_in_progress(self, scheduler, tmp_path):
+        route = respx.post(f"{OSCAR_URL}/scrape").mock(
+            return_value=httpx.Response(200)
+        )
+        schedule = scheduler.add(ScheduleCreate(cron="* * * * *"), now=NOW)
+
+        await scheduler.tick(NEXT_RUN)
+        first_job = schedule.last_job_id
+        (tmp_path / f"{first_job}.json").write_text(
+            CrawlResult(job_id=first_job, status="running").model_dump_json()
+        )
+
+        await scheduler.tick(NEXT_RUN + timedelta(minutes=1))
+        assert route.call_count == 1
+        assert schedule.last_job_id == first_job
+
+        (tmp_path / f"{first_job}.json").write_text(
+            CrawlResult(job_id=first_job, status="completed").model_dump_json()
+        )
+        await scheduler.tick(NEXT_RUN + timedelta(minutes=2))
+        await scheduler.stop()
+
+        assert route.call_count == 2
+        assert schedule.last_job_id != first_job
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_skips_prewarm_while_previous_run_in_progress(
+        self, scheduler, tmp_path
+    ):
+        warmup = respx.post(f"{OSCAR_URL}/warmup").mock(
+            return_value=httpx.Response(200)
+        )
+        respx.post(f"{OSCAR_URL}/scrape").mock(return_value=httpx.Response(200))
+        schedule = scheduler.add(
+            ScheduleCreate(cron="* * * * *", prewarm_seconds=20), now=NOW
+        )
+        await scheduler.tick(NEXT_RUN)
+        warm_calls = warmup.call_count
+        (tmp_path / f"{schedule.last_job_id}.json").write_text(
+            CrawlResult(job_id=schedule.last_job_id, status="running").model_dump_json()
+        )
+
+        await scheduler.tick(NEXT_RUN + timedelta(seconds=50))
+        await scheduler.stop()
+
+        assert warmup.call_count == warm_calls
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_schedule_removed_during_prewarm_does_not_fire(self, scheduler):
+        scrape = respx.post(f"{OSCAR_URL}/scrape").mock(
+            return_value=httpx.Response(200)
+        )
+        first = scheduler.add(
+            ScheduleCreate(cron="* * * * *", prewarm_seconds=20), now=NOW
+        )
+        second = scheduler.add(ScheduleCreate(cron="* * * * *"), now=NOW)
+
+        def remove_both(request):
+            scheduler.remove(first.id)
+            scheduler.remove(second.id)
+            return httpx.Response(200)
+
+        respx.post(f"{OSCAR_URL}/warmup").mock(side_effect=remove_both)
+
+        await scheduler.tick(NEXT_RUN)
+        await scheduler.stop()
+
+        assert scrape.call_count == 0
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_stale_run_does_not_block(self, scheduler, monkeypatch):
+        monkeypatch.setattr("scheduler.RUN_TIMEOUT", 60)
+        route = respx.post(f"{OSCAR_URL}/scrape").mock(
+            return_value=httpx.Response(200)
+        )
+        scheduler.add(ScheduleCreate(cron="*/5 * * * *"), now=NOW)
+
+        await scheduler.tick(datetime(2025, 1, 1, 12, 5, tzinfo=timezone.utc))
+        await scheduler.tick(datetime(2025, 1, 1, 12, 10, tzinfo=timezone.utc))
+        await scheduler.stop()
+
+        assert route.call_count == 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_oscar_failure_keeps_schedule(self, scheduler):
+        respx.post(f"{OSCAR_URL}/scrape").mock(
+            side_effect=httpx.ConnectError("Connection refused")
+        )
+        schedule = scheduler.add(ScheduleCreate(cron="* * * * *"), now=NOW)
+
+        await scheduler.tick(NEXT_RUN)
+        await scheduler.stop()
+
+        assert schedule.last_job_id is None
+        assert schedule.next_run_at == NEXT_RUN + timedelta(minutes=1)
+
+
+class TestLatestSnapshot:
+    def test_none_without_pointer(self, scheduler):
+        assert scheduler.latest_snapshot() is None
+
+    def test_follows_pointer(self, scheduler, tmp_path):
+        for job_id in ("old", "new"):
+            (tmp_path / f"{job_id}.json").write_text(
+                CrawlResult(job_id=job_id, status="completed").model_dump_json()
+            )
+
+        (tmp_path / LATEST_POINTER).write_text("old")
+        assert scheduler.latest_snapshot().job_id == "old"
+
+        (tmp_path / LATEST_POINTER).write_text("new")
+        assert scheduler.latest_snapshot().job_id == "new"
+
+    def test_keeps_cached_snapshot_when_target_missing(self, scheduler, tmp_path):
+        (tmp_path / "good.json").write_text(
+            CrawlResult(job_id="good", status="completed").model_dump_json()
+        )
+        (tmp_path / LATEST_POINTER).write_text("good")
+        scheduler.latest_snapshot()
+
+        (tmp_path / LATEST_POINTER).write_text("missing")
+        assert scheduler.latest_snapshot().job_id == "good"
+
+    def test_none_when_target_invalid(self, scheduler, tmp_path):
+        (tmp_path / "broken.json").write_text("{not json")
+        (tmp_path / LATEST_POINTER).write_text("broken")
+
+        assert scheduler.latest_snapshot() is None
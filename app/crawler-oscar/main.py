@@ -1,7 +1,7 @@
 import logging
 from fastapi import BackgroundTasks, FastAPI
-from pydantic import BaseModel
-from scraper import crawl_oscar
+from pydantic import BaseModel, Field
+from scraper import crawl_oscar, warm_years
 
 logging.basicConfig(level=logging.INFO)
 app = FastAPI(title="Crawler Oscar")
@@ -9,6 +9,7 @@ app = FastAPI(title="Crawler Oscar")
 
 class ScrapeRequest(BaseModel):
     job_id: str
+    stagger_seconds: float = Field(default=0, ge=0)
 
 
 class ScrapeResponse(BaseModel):
@@ -16,7 +17,21 @@ class ScrapeResponse(BaseModel):
     status: str
 
 
+class WarmupRequest(BaseModel):
+    stagger_seconds: float = Field(default=0, ge=0)
+
+
+class WarmupResponse(BaseModel):
+    status: str
+
+
 @app.post("/scrape", response_model=ScrapeResponse)
 async def scrape(request: ScrapeRequest, background_tasks: BackgroundTasks):
-    background_tasks.add_task(crawl_oscar, request.job_id)
+    background_tasks.add_task(crawl_oscar, request.job_id, request.stagger_seconds)
     return ScrapeResponse(job_id=request.job_id, status="pending")
+
+
+@app.post("/warmup", response_model=WarmupResponse)
+async def warmup(request: WarmupRequest, background_tasks: BackgroundTasks):
+    background_tasks.add_task(warm_years, request.stagger_seconds)
+    return WarmupResponse(status="warming")
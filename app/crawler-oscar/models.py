@@ -21,5 +21,6 @@ class CrawlResult(BaseModel):
     job_id: str
     status: Literal["pending", "running", "completed", "failed"]
     films: list[Film] = []
+    started_at: datetime | None = None
     crawled_at: datetime | None = None
     error: str | None = None
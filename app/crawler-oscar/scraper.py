@@ -2,6 +2,8 @@ import asyncio
 import json
 import logging
 import os
+import random
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -24,6 +26,14 @@ YEARS = range(YEAR_START, YEAR_END)
 DATA_DIR = Path(os.environ.get("DATA_DIR", "/app/data"))
 HTTP_TIMEOUT = 30
 MAX_RETRIES = 3
+WARM_CACHE_TTL = float(os.environ.get("WARM_CACHE_TTL", 300))
+LATEST_POINTER = "latest"
+
+# year -> (monotonic time of fetch, films); filled by warm_years and consumed
+# once by the next crawl so a scheduled run starts on already-fetched data.
+_warm_cache: dict[int, tuple[float, list[Film]]] = {}
+# year -> warm-up fetch still in flight; a crawl claims it instead of refetching.
+_warming: dict[int, asyncio.Task[list[Film]]] = {}
 
 
 async def fetch_year_http(client: httpx.AsyncClient, year: int) -> list[Film]:
@@ -90,6 +100,85 @@ async def fetch_year(client: httpx.AsyncClient, year: int) -> list[Film]:
         return await asyncio.to_thread(fetch_year_selenium, year)
 
 
+def _stagger_delay(index: int, count: int, window: float) -> float:
+    """Spread ``count`` starts over ``window`` seconds, one jittered slot each."""
+    if window <= 0 or count <= 0:
+        return 0.0
+    slot = window / count
+    return slot * index + random.uniform(0, slot)
+
+
+def _take_warmed(year: int) -> list[Film] | None:
+    entry = _warm_cache.pop(year, None)
+    if entry is None:
+        return None
+    fetched_at, films = entry
+    if time.monotonic() - fetched_at > WARM_CACHE_TTL:
+        return None
+    logger.info("Using pre-warmed data for %d", year)
+    return films
+
+
+async def _fetch_staggered(
+    client: httpx.AsyncClient, year: int, delay: float
+) -> list[Film]:
+    if delay:
+        await asyncio.sleep(delay)
+    return await fetch_year(client, year)
+
+
+async def _collect_year(
+    client: httpx.AsyncClient, year: int, delay: float
+) -> list[Film]:
+    pending = _warming.pop(year, None)
+    if pending is not None:
+        logger.info("Waiting on in-flight warm-up for %d", year)
+        try:
+            return await pending
+        except Exception as exc:
+            logger.warning("Warm-up failed for %d, fetching again: %s", year, exc)
+
+    warmed = _take_warmed(year)
+    if warmed is not None:
+        return warmed
+    return await _fetch_staggered(client, year, delay)
+
+
+async def warm_years(stagger_seconds: float = 0.0) -> int:
+    # Years another warm-up is already fetching are left to that warm-up.
+    years = [year for year in YEARS if year not in _warming]
+    if not years:
+        logger.info("Warm-up already in flight for every year")
+        return 0
+
+    async with httpx.AsyncClient(timeout=HTTP_TIMEOUT) as client:
+        tasks = {
+            year: asyncio.create_task(
+                _fetch_staggered(
+                    client, year, _stagger_delay(i, len(years), stagger_seconds)
+                )
+            )
+            for i, year in enumerate(years)
+        }
+        _warming.update(tasks)
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+    warmed = 0
+    for year, task in tasks.items():
+        if _warming.get(year) is not task:
+            # Already handed to a crawl that started mid warm-up.
+            continue
+        del _warming[year]
+        if task.exception() is not None:
+            logger.warning("Warm-up failed for %d: %s", year, task.exception())
+            continue
+        _warm_cache[year] = (time.monotonic(), task.result())
+        warmed += 1
+
+    logger.info("Warmed %d/%d years", warmed, len(years))
+    return warmed
+
+
 def _save_result(result: CrawlResult) -> None:
     DATA_DIR.mkdir(parents=True, exist_ok=True)
     path = DATA_DIR / f"{result.job_id}.json"
@@ -97,14 +186,45 @@ def _save_result(result: CrawlResult) -> None:
     logger.info("Saved result to %s", path)
 
 
-async def crawl_oscar(job_id: str) -> CrawlResult:
+def _latest_started_at() -> datetime | None:
+    try:
+        job_id = (DATA_DIR / LATEST_POINTER).read_text().strip()
+        path = DATA_DIR / f"{job_id}.json"
+        return CrawlResult.model_validate_json(path.read_text()).started_at
+    except (OSError, ValueError):
+        return None
+
+
+def _update_latest(result: CrawlResult) -> None:
+    current = _latest_started_at()
+    if current is not None and current >= result.started_at:
+        logger.info("Keeping newer snapshot over %s", result.job_id)
+        return
+
+    # Written via rename so readers never see a half-written pointer.
+    pointer = DATA_DIR / LATEST_POINTER
+    tmp = pointer.with_suffix(".tmp")
+    tmp.write_text(result.job_id)
+    os.replace(tmp, pointer)
+    logger.info("Latest snapshot is now %s", result.job_id)
+
+
+async def crawl_oscar(job_id: str, stagger_seconds: float = 0.0) -> CrawlResult:
     logger.info("Starting crawl job %s", job_id)
-    _save_result(CrawlResult(job_id=job_id, status="running"))
+    # Snapshots are ordered by start time, so a slow older crawl never wins.
+    started_at = datetime.now(timezone.utc)
+    _save_result(CrawlResult(job_id=job_id, status="running", started_at=started_at))
 
     try:
+        years = list(YEARS)
         async with httpx.AsyncClient(timeout=HTTP_TIMEOUT) as client:
             year_results = await asyncio.gather(
-                *[fetch_year(client, year) for year in YEARS],
+                *[
+                    _collect_year(
+                        client, year, _stagger_delay(i, len(years), stagger_seconds)
+                    )
+                    for i, year in enumerate(years)
+                ],
                 return_exceptions=True,
             )
 
@@ -132,6 +252,7 @@ async def crawl_oscar(job_id: str) -> CrawlResult:
             job_id=job_id,
             status=status,
             films=films,
+            started_at=started_at,
             crawled_at=datetime.now(timezone.utc),
             error=error_msg,
         )
@@ -140,11 +261,14 @@ async def crawl_oscar(job_id: str) -> CrawlResult:
         result = CrawlResult(
             job_id=job_id,
             status="failed",
+            started_at=started_at,
             crawled_at=datetime.now(timezone.utc),
             error=str(exc),
         )
 
     _save_result(result)
+    if result.status == "completed" and result.error is None:
+        _update_latest(result)
     logger.info(
         "Crawl job %s finished: status=%s, films=%d",
         job_id,
@@ -20,3 +20,25 @@ class TestScrapeEndpoint:
     def test_scrape_missing_job_id(self):
         response = client.post("/scrape", json={})
         assert response.status_code == 422
+
+    def test_scrape_passes_stagger(self):
+        with patch("main.crawl_oscar", new_callable=AsyncMock) as mock_crawl:
+            client.post("/scrape", json={"job_id": "test-123", "stagger_seconds": 30})
+
+        mock_crawl.assert_awaited_once_with("test-123", 30)
+
+    def test_scrape_rejects_negative_stagger(self):
+        response = client.post(
+            "/scrape", json={"job_id": "test-123", "stagger_seconds": -1}
+        )
+        assert response.status_code == 422
+
+
+class TestWarmupEndpoint:
+    def test_warmup_returns_warming(self):
+        with patch("main.warm_years", new_callable=AsyncMock) as mock_warm:
+            response = client.post("/warmup", json={"stagger_seconds": 10})
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "warming"
+        mock_warm.assert_awaited_once_with(10)
@@ -1,4 +1,6 @@
+import asyncio
 import json
+from datetime import datetime, timezone
 from unittest.mock import patch
 
 import httpx
@@ -7,12 +9,18 @@ import respx
 
 from models import CrawlResult, Film
 from scraper import (
+    LATEST_POINTER,
     TARGET_URL,
     YEARS,
     _save_result,
+    _update_latest,
+    _stagger_delay,
+    _warm_cache,
+    _warming,
     crawl_oscar,
     fetch_year,
     fetch_year_http,
+    warm_years,
 )
 
 SAMPLE_FILMS_JSON = [
@@ -39,6 +47,15 @@ def tmp_data_dir(tmp_path, monkeypatch):
     return tmp_path
 
 
+@pytest.fixture
+def empty_warm_cache():
+    _warm_cache.clear()
+    _warming.clear()
+    yield _warm_cache
+    _warm_cache.clear()
+    _warming.clear()
+
+
 class TestFetchYearHttp:
     @pytest.mark.asyncio
     @respx.mock
@@ -122,6 +139,130 @@ class TestSaveResult:
         assert data["status"] == "completed"
 
 
+class TestStaggerDelay:
+    def test_no_window_means_no_delay(self):
+        assert _stagger_delay(3, 6, 0) == 0.0
+
+    def test_each_start_falls_in_its_own_slot(self):
+        for index in range(6):
+            delay = _stagger_delay(index, 6, 60)
+            assert index * 10 <= delay <= (index + 1) * 10
+
+
+class TestWarmYears:
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_warms_every_year(self, empty_warm_cache):
+        for year in YEARS:
+            respx.get(TARGET_URL, params={"ajax": "true", "year": str(year)}).mock(
+                return_value=httpx.Response(200, json=SAMPLE_FILMS_JSON)
+            )
+
+        warmed = await warm_years()
+
+        assert warmed == len(YEARS)
+        assert set(empty_warm_cache) == set(YEARS)
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_crawl_consumes_warmed_years(self, tmp_data_dir, empty_warm_cache):
+        route = respx.get(TARGET_URL).mock(
+            return_value=httpx.Response(200, json=SAMPLE_FILMS_JSON)
+        )
+        await warm_years()
+        warm_calls = route.call_count
+
+        result = await crawl_oscar("warm-job")
+
+        assert result.status == "completed"
+        assert len(result.films) == len(YEARS) * len(SAMPLE_FILMS_JSON)
+        assert route.call_count == warm_calls
+        assert empty_warm_cache == {}
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_concurrent_warm_ups_fetch_each_year_once(self, empty_warm_cache):
+        route = respx.get(TARGET_URL).mock(
+            return_value=httpx.Response(200, json=SAMPLE_FILMS_JSON)
+        )
+
+        first, second = await asyncio.gather(
+            warm_years(stagger_seconds=0.1), warm_years(stagger_seconds=0.1)
+        )
+
+        assert first + second == len(YEARS)
+        assert route.call_count == len(YEARS)
+        assert set(empty_warm_cache) == set(YEARS)
+        assert _warming == {}
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_crawl_waits_on_in_flight_warm_up(
+        self, tmp_data_dir, empty_warm_cache
+    ):
+        route = respx.get(TARGET_URL).mock(
+            return_value=httpx.Response(200, json=SAMPLE_FILMS_JSON)
+        )
+        warm_up = asyncio.create_task(warm_years(stagger_seconds=0.2))
+        await asyncio.sleep(0)
+
+        result = await crawl_oscar("mid-warm-job")
+        await warm_up
+
+        assert len(result.films) == len(YEARS) * len(SAMPLE_FILMS_JSON)
+        assert route.call_count == len(YEARS)
+        assert empty_warm_cache == {}
+        assert _warming == {}
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_ignores_expired_warm_data(
+        self, tmp_data_dir, empty_warm_cache, monkeypatch
+    ):
+        route = respx.get(TARGET_URL).mock(
+            return_value=httpx.Response(200, json=SAMPLE_FILMS_JSON)
+        )
+        await warm_years()
+        warm_calls = route.call_count
+        monkeypatch.setattr("scraper.WARM_CACHE_TTL", -1)
+
+        await crawl_oscar("expired-job")
+
+        assert route.call_count == warm_calls + len(YEARS)
+
+
+class TestUpdateLatest:
+    def test_does_not_replace_newer_snapshot(self, tmp_data_dir):
+        newer = CrawlResult(
+            job_id="newer",
+            status="completed",
+            started_at=datetime(2025, 1, 1, 12, 5, tzinfo=timezone.utc),
+        )
+        older = CrawlResult(
+            job_id="older",
+            status="completed",
+            started_at=datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc),
+        )
+        _save_result(newer)
+        _update_latest(newer)
+        _save_result(older)
+        _update_latest(older)
+
+        assert (tmp_data_dir / LATEST_POINTER).read_text() == "newer"
+
+    def test_replaces_older_snapshot(self, tmp_data_dir):
+        for minute, job_id in ((0, "older"), (5, "newer")):
+            result = CrawlResult(
+                job_id=job_id,
+                status="completed",
+                started_at=datetime(2025, 1, 1, 12, minute, tzinfo=timezone.utc),
+            )
+            _save_result(result)
+            _update_latest(result)
+
+        assert (tmp_data_dir / LATEST_POINTER).read_text() == "newer"
+
+
 class TestCrawlOscar:
     @pytest.mark.asyncio
     @respx.mock
@@ -137,9 +278,11 @@ class TestCrawlOscar:
         assert result.error is None
         assert len(result.films) == len(YEARS) * len(SAMPLE_FILMS_JSON)
         assert result.crawled_at is not None
+        assert result.started_at <= result.crawled_at
 
         saved = tmp_data_dir / "test-job.json"
         assert saved.exists()
+        assert (tmp_data_dir / LATEST_POINTER).read_text() == "test-job"
 
     @pytest.mark.asyncio
     @respx.mock
@@ -160,6 +303,7 @@ class TestCrawlOscar:
         assert result.status == "completed"
         assert "Partial failures" in result.error
         assert len(result.films) == (len(YEARS) - 1) * len(SAMPLE_FILMS_JSON)
+        assert not (tmp_data_dir / LATEST_POINTER).exists()
 
     @pytest.mark.asyncio
     @respx.mock
@@ -175,3 +319,4 @@ class TestCrawlOscar:
         assert result.status == "failed"
         assert result.error is not None
         assert result.films == []
+        assert not (tmp_data_dir / LATEST_POINTER).exists()